@@ -1,4 +1,5 @@
-import math
+import sys
+import numpy as np
 
 # modify these parameters to determine the bucketing strategy
 # the main things we want are 
@@ -24,32 +25,36 @@ exp_fractions = 4
 
 min_chunk_size = word_size * 3
 
+def write_bins(sizes, first_bin):
+    sys.stdout.write("".join(f"{i:>3}: {s:>8} {s:>20b} | \n" for i, s in enumerate(sizes.tolist(), first_bin)))
+
 word_bins_count = (word_buckets_limit - min_chunk_size) // word_size
 print("word bins count:", word_bins_count)
 
-for i, sb in enumerate(range(min_chunk_size, word_buckets_limit, word_size)):
-    print("{1:>3}: {0:>8} {0:>20b} | ".format(sb, i), end='\n')
+word_sizes = np.arange(min_chunk_size, word_buckets_limit, word_size)
+write_bins(word_sizes, 0)
 
 double_bins_count = (double_buckets_limit - word_buckets_limit) // (2*word_size)
 print("double bins count:", double_bins_count)
 
-for i, bsb in enumerate(range(word_buckets_limit, double_buckets_limit, 2*word_size)):
-    print("{1:>3}: {0:>8} {0:>20b} | ".format(bsb, i), end='\n')
+double_sizes = np.arange(word_buckets_limit, double_buckets_limit, 2*word_size)
+write_bins(double_sizes, 0)
 
 print("pseudo log-spaced bins")
 
-b_ofst = int(math.log2(double_buckets_limit)) # log2_start_pow | 16
-b_p2dv = int(math.log2(exp_fractions)) # log2_div_count | 4
+b_ofst = double_buckets_limit.bit_length() - 1 # log2_start_pow | 16
+b_p2dv = exp_fractions.bit_length() - 1 # log2_div_count | 4
+
+b = np.arange(0, (word_size * 8 * 2) - word_bins_count - double_bins_count, dtype=np.int64)
 
-for b in range(0, (word_size * 8 * 2) - word_bins_count - double_bins_count):
-    # calculation for size from b
-    size = ((1 << b_p2dv) + (b & ((1<<b_p2dv)-1))) << ((b >> b_p2dv) + (b_ofst-b_p2dv))
+# calculation for size from b
+size = ((1 << b_p2dv) + (b & ((1<<b_p2dv)-1))) << ((b >> b_p2dv) + (b_ofst-b_p2dv))
 
-    # calculation of b from size
-    size_log2 = math.floor(math.log2(size))
-    b_calc = ((size >> size_log2 - b_p2dv) ^ (1<<b_p2dv)) + ((size_log2-b_ofst) << b_p2dv)
+# calculation of b from size
+size_log2 = np.frexp(size)[1].astype(np.int64) - 1
+b_calc = ((size >> size_log2 - b_p2dv) ^ (1<<b_p2dv)) + ((size_log2-b_ofst) << b_p2dv)
 
-    # check that they match
-    assert b == b_calc
+# check that they match
+assert np.array_equal(b, b_calc)
 
-    print("{1:>3}: {0:>8} {0:>20b} | ".format(size, b + word_bins_count + double_bins_count), end='\n')
+write_bins(size, word_bins_count + double_bins_count)
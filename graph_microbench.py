@@ -1,21 +1,25 @@
 import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
+import numpy as np
+import functools
 import os
 
 BENCHMARK_RESULTS_DIR = 'benchmark_results/micro/'
 BENCHMARK_RESULT_GRAPHS_DIR = 'talc/benchmark_graphs/'
 
 def get_benchmark_data(filename):
+    # re-read the file only if it has been modified since it was last parsed
+    return read_benchmark_data(filename, os.stat(filename).st_mtime_ns)
+
+@functools.lru_cache(maxsize=None)
+def read_benchmark_data(filename, mtime_ns):
     print("reading", filename)
-    with open(filename, 'r') as f:
-        rows = f.readlines()
-    
     allocators = []
-    for row in rows:
-        lst = row.strip().split(',')
-        if lst[1] != "":
-            allocators.append((lst[0], [float(i) for i in lst[1:]]))
-    return allocators
+    with open(filename, 'r') as f:
+        for row in f:
+            lst = row.strip().split(',')
+            if lst[1] != "":
+                allocators.append((lst[0], tuple(float(i) for i in lst[1:])))
+    return tuple(allocators)
 
 def plot_data(filename, filepath):
     allocators = get_benchmark_data(filepath)
@@ -23,22 +27,23 @@ def plot_data(filename, filepath):
         return
     
     # sort by median
-    allocators.sort(key=lambda a: -a[1][2])
+    allocators = sorted(allocators, key=lambda a: -a[1][2])
 
     print("plotting", filename)
 
-    rightlim = max([x[1][3] for x in allocators])*1.2
+    names = [x[0] for x in allocators]
+    stats = np.asarray([x[1] for x in allocators])
+    rightlim = stats[:, 3].max()*1.2
 
-    plt.boxplot([x[1] for x in allocators], sym="", vert=False, showmeans=False, meanline=False, whis=(0, 100))
+    plt.boxplot(stats.T, sym="", vert=False, showmeans=False, meanline=False, whis=(0, 100))
 
-    i = 1
-    for al in allocators:
-        plt.annotate(str(int(al[1][4])), (rightlim - 50, i), )
-        i += 1
+    labels = np.char.mod('%d', stats[:, 4].astype(np.int64))
+    for i, label in enumerate(labels, 1):
+        plt.annotate(label, (rightlim - 50, i), )
 
     plt.title(filename.split(".")[0])
     plt.xlim(left=0, right=rightlim)
-    plt.yticks(range(1, len(allocators) + 1), [x[0] for x in allocators])
+    plt.yticks(range(1, len(names) + 1), names)
     plt.xlabel("Ticks")
 
     plt.tight_layout()
@@ -50,12 +55,10 @@ def main():
         print("No results dir. Has the benchmark been run?")
         return
     
-    for filename in os.listdir(BENCHMARK_RESULTS_DIR):
-        filepath = BENCHMARK_RESULTS_DIR + filename
-        if not os.path.isfile(filepath):
-            continue
-
-        plot_data(filename, filepath)
+    with os.scandir(BENCHMARK_RESULTS_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.csv'):
+                plot_data(entry.name, entry.path)
 
     print("complete")
 
@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 
 BENCHMARK_RESULTS_DIR = 'benchmark_results/'
@@ -6,16 +7,12 @@ BENCHMARK_RESULT_GRAPHS_DIR = 'talc/benchmark_graphs/'
 
 def get_benchmark_data(filename):
     with open(filename, 'r') as f:
-        rows = f.readlines()
+        max_sizes = [int(i) for i in f.readline().split(',')[1:]]
 
-    max_sizes = [int(i) for i in rows[0].split(',')[1:]]
+        # parse the remaining rows in one go, then split off the allocator names
+        rows = np.loadtxt(f, delimiter=',', dtype=str, ndmin=2)
 
-    allocators = {}
-    for row in rows[1:]:
-        lst = row.split(',')
-        allocators[lst[0]] = [float(i) for i in lst[1:]]
-
-    return max_sizes, allocators
+    return max_sizes, rows[:, 0].tolist(), rows[:, 1:].astype(np.float64)
 
 def main():
     if not os.path.exists(BENCHMARK_RESULTS_DIR):
@@ -23,16 +20,13 @@ def main():
 
     filename = "Random Actions Benchmark.csv"
 
-    max_sizes, data = get_benchmark_data(BENCHMARK_RESULTS_DIR + filename)
+    max_sizes, names, data = get_benchmark_data(BENCHMARK_RESULTS_DIR + filename)
 
-    yvalues = []
-    for k, v in data.items():
-        plt.plot(max_sizes, v, label=k)
-        yvalues.append(v)
+    lines = plt.plot(max_sizes, data.T)
 
     plt.xscale('log')
     plt.yscale('log')
-    plt.legend()
+    plt.legend(lines, names)
 
     plt.title(filename[:filename.find('.csv')])
     plt.xticks(ticks=max_sizes, labels=[str(x) + " / " + str(x*10) for x in max_sizes], rotation=15)